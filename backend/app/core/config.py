@@ -11,6 +11,16 @@ from typing import List, Optional, Union, Any
 from pydantic_settings import BaseSettings
 from pydantic import field_validator, AnyHttpUrl, ValidationInfo
 
+
+@lru_cache(maxsize=None)
+def _parse_origins(raw: str) -> tuple:
+    """Parse a comma-separated CORS origin string into a tuple of origins.
+
+    Cached so repeated settings builds (tests, hot-reload) skip the scan.
+    """
+    return tuple(origin.strip() for origin in raw.split(",") if origin.strip())
+
+
 class ApplicationSettings(BaseSettings):
     """Application configuration with environment variable support"""
 
@@ -30,6 +40,9 @@ class ApplicationSettings(BaseSettings):
     allowed_methods: List[str] = ["*"]
     allowed_headers: List[str] = ["*"]
 
+    # Host header allow-list; ["*"] disables the TrustedHost middleware layer
+    trusted_hosts: List[str] = ["*"]
+
     # Database Configuration
     mongodb_connection_string: str = "mongodb://localhost:27017"
     database_name: str = "traffic_management"
@@ -44,6 +57,8 @@ class ApplicationSettings(BaseSettings):
     non_max_suppression_threshold: float = 0.45
     enable_gpu_acceleration: bool = True
     model_cache_directory: str = "./models"
+    # "fp16" halves inference cost on GPUs with tensor cores; ignored on CPU
+    inference_precision: str = "fp32"
 
     # Traffic Management Settings
     default_green_signal_duration: int = 30  # seconds
@@ -80,7 +95,8 @@ class ApplicationSettings(BaseSettings):
         """Parse CORS origins from environment variable if it's a string"""
         if isinstance(v, str) and not v.startswith("["):
             # If it's a string and doesn't look like a JSON list, split by comma
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
+            # (parse is cached, so revalidation reuses the previous result)
+            return list(_parse_origins(v))
         elif isinstance(v, list):
             # If it's already a list, return it
             return v
@@ -88,6 +104,15 @@ class ApplicationSettings(BaseSettings):
         # Returning ["*"] if input is invalid/empty might be safer
         return ["*"] # Or handle error based on requirements
 
+    @field_validator("inference_precision")
+    @classmethod
+    def validate_inference_precision(cls, v: str):
+        """Validate the requested model inference precision"""
+        precision = v.lower()
+        if precision not in ("fp32", "fp16"):
+            raise ValueError("Inference precision must be 'fp32' or 'fp16'")
+        return precision
+
     # Use field_validator (default mode is 'after') for standard validation
     @field_validator("detection_confidence_threshold")
     @classmethod
@@ -148,21 +173,21 @@ class TestingSettings(ApplicationSettings):
     jwt_secret_key: str = "test_secret_key"
 
 
+# Environment name -> settings class, resolved once at import time
+_SETTINGS_CLASSES = {
+    "production": ProductionSettings,
+    "testing": TestingSettings,
+    "development": DevelopmentSettings,
+}
+
+
 @lru_cache()
 def get_application_settings() -> ApplicationSettings:
     """Get application settings based on environment"""
     environment = os.getenv("ENVIRONMENT", "development").lower()
-    print(f"[⚙️] Environment detected: {environment.upper()}")
-
-    if environment == "production":
-        print("[🏭] Loading PRODUCTION settings...")
-        return ProductionSettings()
-    elif environment == "testing":
-        print("[🧪] Loading TESTING settings...")
-        return TestingSettings()
-    else:
-        print("[🔧] Loading DEVELOPMENT settings...")
-        return DevelopmentSettings()
+    settings_class = _SETTINGS_CLASSES.get(environment, DevelopmentSettings)
+    print(f"[⚙️] Environment detected: {environment.upper()} -> {settings_class.__name__}")
+    return settings_class()
 
 
 # Global settings instance, loaded based on ENVIRONMENT variable
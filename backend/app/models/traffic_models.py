@@ -3,12 +3,47 @@ Traffic Management System Data Models
 Defines all data structures using Pydantic for validation and serialization
 """
 
-from datetime import datetime
-from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+import logging
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum, IntEnum
+from functools import cached_property
+from typing import Dict, List, NamedTuple, Optional, Any, Union
+
+import numpy as np
 
 # Updated import for Pydantic V2 validator
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, computed_field,
+    field_serializer, field_validator, model_validator
+)
+
+logger = logging.getLogger(__name__)
+
+# One-shot guard so a misbehaving producer logs once, not per detection
+_warned_bad_lane_counts = False
+
+_UTC = timezone.utc
+
+
+def _intern_id(v: Any) -> Any:
+    """Intern small identifier strings.
+
+    IDs such as signal/alert/snapshot ids repeat across thousands of
+    long-lived instances; interning makes identical ids share one
+    PyUnicode object (and turns their comparisons into pointer checks).
+    """
+    return sys.intern(v) if isinstance(v, str) else v
+
+
+def utcnow() -> datetime:
+    """Timezone-aware UTC now.
+
+    Bound once at module level so the per-instance default_factory is a
+    single C call; also replaces the deprecated tz-naive datetime.utcnow().
+    """
+    return datetime.now(_UTC)
 
 
 class TrafficSignalState(str, Enum):
@@ -28,6 +63,11 @@ class LaneDirection(str, Enum):
     WEST = "west"
 
 
+# Enum.__iter__ walks descriptors on every call; lane validators run per
+# detection result, so iterate this precomputed tuple instead
+_LANE_DIRECTIONS: tuple = tuple(LaneDirection)
+
+
 class VehicleType(str, Enum):
     """Types of detected vehicles"""
     CAR = "car"
@@ -48,54 +88,206 @@ class EmergencyType(str, Enum):
     OTHER = "other"
 
 
+# value -> member maps built once at import: a flat dict .get resolves the
+# inbound strings of each payload without entering Enum.__call__ at all, so
+# pydantic's enum step then sees an already-resolved member
+_SIGNAL_STATE_FROM_STR: Dict[str, TrafficSignalState] = {m.value: m for m in TrafficSignalState}
+_LANE_FROM_STR: Dict[str, LaneDirection] = {m.value: m for m in LaneDirection}
+_VTYPE_FROM_STR: Dict[str, VehicleType] = {m.value: m for m in VehicleType}
+_EMERGENCY_FROM_STR: Dict[str, EmergencyType] = {m.value: m for m in EmergencyType}
+
+
+class SystemStatus(IntEnum):
+    """Overall system state, ordered by severity.
+
+    IntEnum so per-tick state checks are single int compares and severity
+    thresholds can be written as `status >= SystemStatus.DEGRADED`.
+    """
+    OPERATIONAL = 0
+    DEGRADED = 1
+    EMERGENCY = 2
+    ERROR = 3
+
+
+# Accepts the legacy wire strings; "ok" was SystemHealthStatus's old default
+_SYSTEM_STATUS_FROM_STR: Dict[str, SystemStatus] = {
+    'ok': SystemStatus.OPERATIONAL,
+    'operational': SystemStatus.OPERATIONAL,
+    'degraded': SystemStatus.DEGRADED,
+    'emergency': SystemStatus.EMERGENCY,
+    'error': SystemStatus.ERROR,
+}
+
+
+def _coerce_system_status(v: Any) -> Any:
+    if isinstance(v, str):
+        member = _SYSTEM_STATUS_FROM_STR.get(v.lower())
+        if member is not None:
+            return member
+    return v
+
+
+class BoundingBox(NamedTuple):
+    """Pixel bounding box (x1, y1, x2, y2).
+
+    A fixed tuple instead of a 4-entry dict: per-detection lists allocate one
+    of these per vehicle, and the tuple layout avoids hash-table overhead
+    while its arity enforces the coordinate schema.
+    """
+    x1: int
+    y1: int
+    x2: int
+    y2: int
+
+
+class CenterPoint(NamedTuple):
+    """Normalized center coordinates (x, y)"""
+    x: float
+    y: float
+
+
 class DetectedVehicle(BaseModel):
     """Represents a single detected vehicle"""
 
+    model_config = ConfigDict(validate_assignment=False, extra='ignore', defer_build=True)
+
     vehicle_type: VehicleType
     confidence: float = Field(..., ge=0.0, le=1.0)
-    bounding_box: Dict[str, int] = Field(..., description="Bounding box coordinates {x1, y1, x2, y2}")
-    center_coordinates: Dict[str, float] = Field(..., description="Normalized center coordinates {x, y}")
+    bounding_box: BoundingBox = Field(..., description="Bounding box coordinates (x1, y1, x2, y2)")
+    center_coordinates: CenterPoint = Field(..., description="Normalized center coordinates (x, y)")
     lane: LaneDirection
     is_emergency: bool = False
     vehicle_id: Optional[str] = None
-    detection_timestamp: datetime = Field(default_factory=datetime.utcnow)
+    # The frame timestamp lives on VehicleDetectionResult; per-vehicle values
+    # are only for multi-camera producers, so don't allocate N datetimes for
+    # the common single-frame case
+    detection_timestamp: Optional[datetime] = None
 
-    # --- Updated Validator for Pydantic V2 ---
-    @field_validator('bounding_box')
+    @field_validator('vehicle_type', mode='before')
     @classmethod
-    def validate_bounding_box(cls, v: Dict[str, int]) -> Dict[str, int]:
-        required_keys = {'x1', 'y1', 'x2', 'y2'}
-        if not required_keys.issubset(v.keys()):
-            raise ValueError(f"Bounding box must contain keys: {required_keys}")
-        if v['x2'] <= v['x1'] or v['y2'] <= v['y1']:
-            raise ValueError("Invalid bounding box coordinates (x2 <= x1 or y2 <= y1)")
-        return v
+    def _coerce_vehicle_type(cls, v: Any) -> Any:
+        return _VTYPE_FROM_STR.get(v, v) if isinstance(v, str) else v
 
-    # --- Updated Validator for Pydantic V2 ---
-    @field_validator('center_coordinates')
+    @field_validator('lane', mode='before')
     @classmethod
-    def validate_center_coordinates(cls, v: Dict[str, float]) -> Dict[str, float]:
-        required_keys = {'x', 'y'}
-        if not required_keys.issubset(v.keys()):
-            raise ValueError(f"Center coordinates must contain keys: {required_keys}")
-        if not (0 <= v['x'] <= 1 and 0 <= v['y'] <= 1):
+    def _coerce_lane(cls, v: Any) -> Any:
+        return _LANE_FROM_STR.get(v, v) if isinstance(v, str) else v
+
+    # One Python callback per instance: pydantic-core natively coerces the
+    # legacy dict forms ({'x1': ..}, {'x': ..}) into the NamedTuples in Rust,
+    # so only the geometry checks need to drop back into Python
+    @model_validator(mode='after')
+    def _check_geometry(self) -> 'DetectedVehicle':
+        box = self.bounding_box
+        if box.x2 <= box.x1 or box.y2 <= box.y1:
+            raise ValueError("Invalid bounding box coordinates (x2 <= x1 or y2 <= y1)")
+        center = self.center_coordinates
+        if not (0 <= center.x <= 1 and 0 <= center.y <= 1):
             raise ValueError("Center coordinates must be normalized (between 0 and 1)")
-        return v
+        return self
+
+    # Clients (and the frontend) consume these as JSON objects, so keep the
+    # wire format keyed even though the in-memory layout is a tuple
+    @field_serializer('bounding_box')
+    def serialize_bounding_box(self, v: BoundingBox) -> Dict[str, int]:
+        return v._asdict()
+
+    @field_serializer('center_coordinates')
+    def serialize_center_coordinates(self, v: CenterPoint) -> Dict[str, float]:
+        return v._asdict()
+
+
+# Enum member -> array index, fixed by declaration order
+_LANE_INDEX: Dict[LaneDirection, int] = {lane: i for i, lane in enumerate(LaneDirection)}
+_VEHICLE_TYPE_INDEX: Dict[VehicleType, int] = {vt: i for i, vt in enumerate(VehicleType)}
+
+
+@dataclass(slots=True)
+class DetectedVehiclesBatch:
+    """Structure-of-arrays view over a list of detections.
+
+    Aggregations (lane counts, emergency flag, confidence stats) over a
+    `List[DetectedVehicle]` walk scattered Python objects; the parallel
+    NumPy arrays here keep each attribute contiguous so those reductions
+    run as vectorized C loops instead.
+    """
+
+    bbox: np.ndarray          # (N, 4) int32 — x1, y1, x2, y2
+    center: np.ndarray        # (N, 2) float32 — normalized x, y
+    confidence: np.ndarray    # (N,) uint16 — q16 fixed point, value = raw / 65535
+    lane: np.ndarray          # (N,) int8 — index into LaneDirection
+    vtype: np.ndarray         # (N,) int8 — index into VehicleType
+    is_emergency: np.ndarray  # (N,) bool
+
+    @classmethod
+    def from_models(cls, vehicles: List['DetectedVehicle']) -> 'DetectedVehiclesBatch':
+        """Pack model instances into column arrays"""
+        count = len(vehicles)
+        batch = cls(
+            bbox=np.empty((count, 4), dtype=np.int32),
+            center=np.empty((count, 2), dtype=np.float32),
+            confidence=np.empty(count, dtype=np.uint16),
+            lane=np.empty(count, dtype=np.int8),
+            vtype=np.empty(count, dtype=np.int8),
+            is_emergency=np.empty(count, dtype=bool),
+        )
+        for i, vehicle in enumerate(vehicles):
+            batch.bbox[i] = vehicle.bounding_box
+            batch.center[i] = vehicle.center_coordinates
+            batch.confidence[i] = round(vehicle.confidence * 65535)
+            batch.lane[i] = _LANE_INDEX[vehicle.lane]
+            batch.vtype[i] = _VEHICLE_TYPE_INDEX[vehicle.vehicle_type]
+            batch.is_emergency[i] = vehicle.is_emergency
+        return batch
+
+    def to_models(self) -> List['DetectedVehicle']:
+        """Materialize the legacy per-vehicle model list"""
+        lanes = tuple(LaneDirection)
+        vehicle_types = tuple(VehicleType)
+        return [
+            DetectedVehicle(
+                vehicle_type=vehicle_types[self.vtype[i]],
+                confidence=float(self.confidence[i]) / 65535.0,
+                bounding_box=BoundingBox(*self.bbox[i].tolist()),
+                center_coordinates=CenterPoint(*self.center[i].tolist()),
+                lane=lanes[self.lane[i]],
+                is_emergency=bool(self.is_emergency[i]),
+            )
+            for i in range(len(self.confidence))
+        ]
+
+    def lane_counts(self) -> Dict[LaneDirection, int]:
+        """Vehicles per lane via a single bincount pass"""
+        counts = np.bincount(self.lane, minlength=len(LaneDirection))
+        return dict(zip(LaneDirection, counts.tolist()))
+
+    @property
+    def confidence_f32(self) -> np.ndarray:
+        """Dequantized confidences; 1/65535 resolution loses nothing for a 0-1 score"""
+        return self.confidence.astype(np.float32) * np.float32(1.0 / 65535.0)
+
+    def confidence_scores(self) -> List[float]:
+        return self.confidence_f32.tolist()
+
+    def has_emergency_vehicles(self) -> bool:
+        return bool(self.is_emergency.any())
 
 
 class VehicleDetectionResult(BaseModel):
     """Result of vehicle detection analysis"""
 
-    total_vehicles: int = Field(..., ge=0)
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
+
     lane_counts: Dict[LaneDirection, int] = Field(default_factory=dict)
     detected_vehicles: List[DetectedVehicle] = Field(default_factory=list)
     confidence_scores: List[float] = Field(default_factory=list)
     processing_time: float = Field(..., gt=0)
     image_path: str # Consider making this Optional if not always available
     annotated_image_path: Optional[str] = None
-    has_emergency_vehicles: bool = False
     traffic_density: float = Field(default=0.0, ge=0.0) # Consider adding validation ge=0, le=1?
-    detection_timestamp: datetime = Field(default_factory=datetime.utcnow)
+    detection_timestamp: datetime = Field(default_factory=utcnow)
+    # Optional SoA view for aggregation-heavy callers; never serialized
+    batch: Optional[DetectedVehiclesBatch] = Field(default=None, exclude=True)
 
     # --- Updated Validator for Pydantic V2 ---
     # Use mode='before' if you want this to run before type validation (e.g., if input might not be a dict)
@@ -108,24 +300,70 @@ class VehicleDetectionResult(BaseModel):
         if not isinstance(v, dict):
              # You might want to raise an error or return a default dict
              # For robustness, let's create a default dict if input is bad
-             print(f"Warning: lane_counts input was not a dict, got {type(v)}. Resetting.")
+             global _warned_bad_lane_counts
+             if not _warned_bad_lane_counts:
+                 _warned_bad_lane_counts = True
+                 logger.warning("lane_counts input was not a dict, got %s; resetting", type(v))
              v = {}
 
+        # Fast path: producers that already emit all four lanes skip the
+        # dict rebuild (and its per-key enum hashing) entirely
+        if len(v) == 4:
+            for lane in _LANE_DIRECTIONS:
+                if lane not in v:
+                    break
+            else:
+                return v
+
         # Ensure all enum members are keys
-        validated_counts = {lane: v.get(lane, 0) for lane in LaneDirection}
+        validated_counts = {lane: v.get(lane, 0) for lane in _LANE_DIRECTIONS}
         return validated_counts
 
+    # Derived once from the vehicle data instead of stored alongside it:
+    # producers no longer maintain duplicate totals that can drift, and the
+    # cached value serializes under the same key as before
+    @computed_field
+    @cached_property
+    def total_vehicles(self) -> int:
+        if self.batch is not None:
+            return int(self.batch.confidence.size)
+        return len(self.detected_vehicles)
+
+    @computed_field
+    @cached_property
+    def has_emergency_vehicles(self) -> bool:
+        if self.batch is not None:
+            return self.batch.has_emergency_vehicles()
+        return any(v.is_emergency for v in self.detected_vehicles)
+
 
 class TrafficSignal(BaseModel):
     """Represents a traffic signal state and timing"""
 
+    model_config = ConfigDict(defer_build=True)
+
     signal_id: str
     direction: LaneDirection
     current_state: TrafficSignalState
     remaining_time: int = Field(..., ge=0, description="Remaining time in seconds")
     next_state: Optional[TrafficSignalState] = None
     cycle_duration: int = Field(default=60, gt=0, description="Total cycle duration in seconds")
-    last_updated: datetime = Field(default_factory=datetime.utcnow)
+    last_updated: datetime = Field(default_factory=utcnow)
+
+    @field_validator('signal_id', mode='before')
+    @classmethod
+    def _intern(cls, v: Any) -> Any:
+        return _intern_id(v)
+
+    @field_validator('direction', mode='before')
+    @classmethod
+    def _coerce_direction(cls, v: Any) -> Any:
+        return _LANE_FROM_STR.get(v, v) if isinstance(v, str) else v
+
+    @field_validator('current_state', 'next_state', mode='before')
+    @classmethod
+    def _coerce_state(cls, v: Any) -> Any:
+        return _SIGNAL_STATE_FROM_STR.get(v, v) if isinstance(v, str) else v
 
     def is_active(self) -> bool:
         """Check if signal allows traffic flow"""
@@ -135,31 +373,75 @@ class TrafficSignal(BaseModel):
 class IntersectionStatus(BaseModel):
     """Complete status of traffic intersection"""
 
-    intersection_id: str = Field(default="main_intersection")
+    model_config = ConfigDict(defer_build=True)
+
+    intersection_id: str = Field(default=sys.intern("main_intersection"))
     traffic_signals: Dict[LaneDirection, TrafficSignal] = Field(default_factory=dict)
-    vehicle_counts: Dict[LaneDirection, int] = Field(default_factory=dict) # Should probably match VehicleDetectionResult.lane_counts
     total_vehicles: int = 0
     traffic_flow_rate: float = Field(default=0.0, ge=0.0)
     average_wait_time: float = Field(default=0.0, ge=0.0)
     emergency_mode_active: bool = False
-    system_status: str = Field(default="operational") # Consider using an Enum for status
+    system_status: SystemStatus = Field(default=SystemStatus.OPERATIONAL)
     last_detection_time: Optional[datetime] = None
-    last_updated: datetime = Field(default_factory=datetime.utcnow)
+    last_updated: datetime = Field(default_factory=utcnow)
+
+    # Latest per-lane counts, adopted by reference from the detection
+    # result each tick — no copy, no validator run
+    _lane_counts: Dict[LaneDirection, int] = PrivateAttr(
+        default_factory=lambda: {lane: 0 for lane in _LANE_DIRECTIONS}
+    )
 
-    # Optional: Add validator to ensure vehicle_counts covers all lanes like in VehicleDetectionResult
-    @field_validator('vehicle_counts', mode='before')
+    @field_validator('intersection_id', mode='before')
     @classmethod
-    def ensure_all_intersection_lanes_present(cls, v: Union[Dict[LaneDirection, int], Any]) -> Dict[LaneDirection, int]:
-        """Ensure all lane directions are represented in intersection counts"""
-        if not isinstance(v, dict):
-             v = {}
-        validated_counts = {lane: v.get(lane, 0) for lane in LaneDirection}
-        return validated_counts
+    def _intern(cls, v: Any) -> Any:
+        return _intern_id(v)
+
+    @field_validator('system_status', mode='before')
+    @classmethod
+    def _coerce_status(cls, v: Any) -> Any:
+        return _coerce_system_status(v)
+
+    # The dashboard matches on the lowercase status string, so keep emitting it
+    @field_serializer('system_status')
+    def serialize_system_status(self, v: SystemStatus) -> str:
+        return v.name.lower()
+
+    # Serializes under the same key as the old stored field, but the data
+    # lives once — on the detection result that produced it
+    @computed_field
+    @property
+    def vehicle_counts(self) -> Dict[LaneDirection, int]:
+        return self._lane_counts
+
+    def set_vehicle_counts(self, counts: Dict[LaneDirection, int]) -> None:
+        """Adopt the latest detection's lane counts.
+
+        Complete dicts (the detector always emits all four lanes) are
+        referenced as-is; partial input falls back to a normalizing copy.
+        """
+        if len(counts) == 4:
+            self._lane_counts = counts
+        else:
+            self._lane_counts = {lane: counts.get(lane, 0) for lane in _LANE_DIRECTIONS}
+
+    # Accessors for the controller's per-tick hot paths; str-enum keys hash
+    # once (str caches its hash), so these stay a single dict probe
+    def get_signal(self, lane: LaneDirection) -> Optional[TrafficSignal]:
+        """Signal for a lane, or None before initialization"""
+        return self.traffic_signals.get(lane)
+
+    def get_vehicle_count(self, lane: LaneDirection) -> int:
+        """Last observed vehicle count for a lane"""
+        return self._lane_counts.get(lane, 0)
 
 
 class EmergencyAlert(BaseModel):
     """Emergency vehicle alert information"""
 
+    # Created once, then only read and serialized; frozen instances skip
+    # assignment validation and hash/compare cheaply
+    model_config = ConfigDict(frozen=True, extra='ignore', defer_build=True)
+
     alert_id: str
     emergency_type: EmergencyType
     detected_lane: LaneDirection
@@ -168,28 +450,106 @@ class EmergencyAlert(BaseModel):
     estimated_arrival_time: Optional[int] = Field(None, description="ETA in seconds to intersection")
     override_duration: int = Field(default=60, gt=0, description="Requested signal override duration")
     is_active: bool = True
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
     resolved_at: Optional[datetime] = None
 
+    @field_validator('alert_id', mode='before')
+    @classmethod
+    def _intern(cls, v: Any) -> Any:
+        return _intern_id(v)
+
+    @field_validator('emergency_type', mode='before')
+    @classmethod
+    def _coerce_emergency_type(cls, v: Any) -> Any:
+        return _EMERGENCY_FROM_STR.get(v, v) if isinstance(v, str) else v
+
+    @field_validator('detected_lane', mode='before')
+    @classmethod
+    def _coerce_lane(cls, v: Any) -> Any:
+        return _LANE_FROM_STR.get(v, v) if isinstance(v, str) else v
+
+
+class PerformanceMetrics(BaseModel):
+    """Runtime metrics attached to a snapshot.
+
+    Closed schema instead of Dict[str, Any] so pydantic-core validates a
+    fixed struct rather than boxing arbitrary values per key.
+    """
+
+    model_config = ConfigDict(extra='forbid', defer_build=True)
+
+    fps: float = 0.0
+    detection_ms: float = 0.0
+    signal_ms: float = 0.0
+    queue_depth: int = 0
+
+
+class SystemHealth(BaseModel):
+    """Per-component liveness flags"""
+
+    model_config = ConfigDict(extra='forbid', defer_build=True)
+
+    cv_module: bool = True
+    api_server: bool = True
+    database: bool = True
+
 
 class TrafficSnapshot(BaseModel):
     """Snapshot of traffic system state at a point in time"""
 
+    model_config = ConfigDict(frozen=True, extra='ignore', defer_build=True)
+
     snapshot_id: str # Consider using UUID or similar
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
     intersection_status: IntersectionStatus
     vehicle_detection_result: Optional[VehicleDetectionResult] = None
     active_emergency_alerts: List[EmergencyAlert] = Field(default_factory=list)
-    performance_metrics: Dict[str, Any] = Field(default_factory=dict)
-    # Assuming system_health uses boolean flags for component status
-    system_health: Dict[str, bool] = Field(default_factory=lambda: {"cv_module": True, "api_server": True, "database": True})
+    performance_metrics: PerformanceMetrics = Field(default_factory=PerformanceMetrics)
+    system_health: SystemHealth = Field(default_factory=SystemHealth)
+
+    @field_validator('snapshot_id', mode='before')
+    @classmethod
+    def _intern(cls, v: Any) -> Any:
+        return _intern_id(v)
 
 
 # --- ADDED Missing Class Definition ---
 class SystemHealthStatus(BaseModel):
     """Model for the system health check endpoint"""
-    status: str = Field(default="ok", description="Overall system status (e.g., 'ok', 'degraded', 'error')")
+
+    model_config = ConfigDict(defer_build=True)
+    status: SystemStatus = Field(default=SystemStatus.OPERATIONAL, description="Overall system status")
     message: Optional[str] = Field(default=None, description="Optional message providing more details")
     version: Optional[str] = Field(default=None, description="Application version")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=utcnow)
     components: Dict[str, bool] = Field(default_factory=dict, description="Status of individual components (e.g., {'database': True})")
+
+    @field_validator('status', mode='before')
+    @classmethod
+    def _coerce_status(cls, v: Any) -> Any:
+        return _coerce_system_status(v)
+
+    @field_serializer('status')
+    def serialize_status(self, v: SystemStatus) -> str:
+        return v.name.lower()
+
+
+# Schemas are deferred above; build them in one batch now that every
+# cross-referenced class exists, which is cheaper than the interleaved
+# per-class builds pydantic does by default
+for _model in (TrafficSignal, DetectedVehicle, VehicleDetectionResult,
+               IntersectionStatus, EmergencyAlert, PerformanceMetrics,
+               SystemHealth, TrafficSnapshot, SystemHealthStatus):
+    _model.model_rebuild()
+del _model
+
+
+# Prebuilt adapters for hot-path (de)serialization. Building a TypeAdapter
+# repays its schema-construction cost on every call, so anything emitting
+# these types per tick should reuse this module's instances.
+INTERSECTION_STATUS_ADAPTER: TypeAdapter = TypeAdapter(IntersectionStatus)
+DETECTION_RESULT_ADAPTER: TypeAdapter = TypeAdapter(VehicleDetectionResult)
+EMERGENCY_ALERT_ADAPTER: TypeAdapter = TypeAdapter(EmergencyAlert)
+DETECTED_VEHICLES_ADAPTER: TypeAdapter = TypeAdapter(List[DetectedVehicle])
+EMERGENCY_ALERTS_ADAPTER: TypeAdapter = TypeAdapter(List[EmergencyAlert])
+SNAPSHOT_ADAPTER: TypeAdapter = TypeAdapter(TrafficSnapshot)
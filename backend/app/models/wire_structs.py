@@ -0,0 +1,114 @@
+"""
+msgspec wire-format mirrors of the hot traffic models
+For trusted inter-service transport (WebSocket fan-out, message queues)
+where the producer has already validated: msgspec.Struct encodes and
+decodes at C speed with no per-field Python callbacks. Pydantic stays on
+the HTTP boundary where external validation matters.
+"""
+
+from typing import List, Optional, Tuple
+
+import msgspec
+
+from .traffic_models import (
+    BoundingBox, CenterPoint, DetectedVehicle, LaneDirection,
+    TrafficSignalState, VehicleDetectionResult, VehicleType,
+    _LANE_INDEX, _VEHICLE_TYPE_INDEX,
+)
+
+# Ordinal -> member, matching the index maps used by the SoA batch
+_LANES = tuple(LaneDirection)
+_VEHICLE_TYPES = tuple(VehicleType)
+_SIGNAL_STATES = tuple(TrafficSignalState)
+
+
+class DetectedVehicleStruct(msgspec.Struct, array_like=True, gc=False):
+    """Compact per-vehicle record; enums travel as ordinal ints.
+
+    array_like packs fields positionally (no key strings on the wire)
+    and gc=False is safe because the struct holds no cyclic references.
+    """
+
+    vehicle_type: int
+    confidence: float
+    bbox: Tuple[int, int, int, int]
+    center: Tuple[float, float]
+    lane: int
+    is_emergency: bool = False
+
+    @classmethod
+    def from_model(cls, vehicle: DetectedVehicle) -> 'DetectedVehicleStruct':
+        return cls(
+            vehicle_type=_VEHICLE_TYPE_INDEX[vehicle.vehicle_type],
+            confidence=vehicle.confidence,
+            bbox=tuple(vehicle.bounding_box),
+            center=tuple(vehicle.center_coordinates),
+            lane=_LANE_INDEX[vehicle.lane],
+            is_emergency=vehicle.is_emergency,
+        )
+
+    def to_model(self) -> DetectedVehicle:
+        return DetectedVehicle(
+            vehicle_type=_VEHICLE_TYPES[self.vehicle_type],
+            confidence=self.confidence,
+            bounding_box=BoundingBox(*self.bbox),
+            center_coordinates=CenterPoint(*self.center),
+            lane=_LANES[self.lane],
+            is_emergency=self.is_emergency,
+        )
+
+
+class DetectionResultStruct(msgspec.Struct, array_like=True, gc=False):
+    """Per-frame detection payload for the streaming path"""
+
+    vehicles: List[DetectedVehicleStruct]
+    lane_counts: Tuple[int, int, int, int]
+    processing_time: float
+    timestamp: float  # UTC epoch seconds
+    image_path: Optional[str] = None
+
+    @classmethod
+    def from_model(cls, result: VehicleDetectionResult) -> 'DetectionResultStruct':
+        return cls(
+            vehicles=[DetectedVehicleStruct.from_model(v) for v in result.detected_vehicles],
+            lane_counts=tuple(result.lane_counts.get(lane, 0) for lane in _LANES),
+            processing_time=result.processing_time,
+            timestamp=result.detection_timestamp.timestamp(),
+            image_path=result.image_path,
+        )
+
+
+class TrafficSignalStruct(msgspec.Struct, array_like=True, gc=False):
+    """Signal state for one lane; state/direction as ordinals"""
+
+    direction: int
+    state: int
+    remaining_time: int
+
+
+class IntersectionStatusStruct(msgspec.Struct, array_like=True, gc=False):
+    """Per-tick intersection state for the broadcast loop"""
+
+    signals: List[TrafficSignalStruct]
+    vehicle_counts: Tuple[int, int, int, int]
+    total_vehicles: int
+    emergency_mode_active: bool = False
+
+
+# One encoder/decoder pair per process; construction repays schema cost
+_encoder = msgspec.json.Encoder()
+_detection_decoder = msgspec.json.Decoder(DetectionResultStruct)
+_status_decoder = msgspec.json.Decoder(IntersectionStatusStruct)
+
+
+def encode(struct: msgspec.Struct) -> bytes:
+    """Serialize any wire struct to JSON bytes"""
+    return _encoder.encode(struct)
+
+
+def decode_detection_result(payload: bytes) -> DetectionResultStruct:
+    return _detection_decoder.decode(payload)
+
+
+def decode_intersection_status(payload: bytes) -> IntersectionStatusStruct:
+    return _status_decoder.decode(payload)
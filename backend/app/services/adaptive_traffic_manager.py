@@ -5,14 +5,14 @@ Intelligent traffic signal optimization based on real-time vehicle detection
 
 import asyncio
 import time
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Dict, List, Optional
 
 from ..core.config import settings
 from ..core.logger import LoggerMixin
 from ..models.traffic_models import (
     IntersectionStatus, TrafficSignal, TrafficSignalState, 
-    LaneDirection, EmergencyAlert, VehicleDetectionResult
+    LaneDirection, EmergencyAlert, VehicleDetectionResult, utcnow
 )
 
 
@@ -95,7 +95,7 @@ class AdaptiveTrafficManager(LoggerMixin):
     
     async def _update_signal_states(self) -> None:
         """Update traffic signal states based on timing and conditions"""
-        current_time = datetime.utcnow()
+        current_time = utcnow()
         
         for lane, signal in self.intersection_status.traffic_signals.items():
             # Decrease remaining time
@@ -143,7 +143,7 @@ class AdaptiveTrafficManager(LoggerMixin):
         perpendicular_lanes = self._get_perpendicular_lanes(lane)
         
         for perp_lane in perpendicular_lanes:
-            perp_signal = self.intersection_status.traffic_signals[perp_lane]
+            perp_signal = self.intersection_status.get_signal(perp_lane)
             if perp_signal.current_state in [TrafficSignalState.GREEN, TrafficSignalState.YELLOW]:
                 return False
         
@@ -158,7 +158,7 @@ class AdaptiveTrafficManager(LoggerMixin):
     
     def _calculate_green_duration(self, lane: LaneDirection) -> int:
         """Calculate optimal green signal duration based on traffic density"""
-        vehicle_count = self.intersection_status.vehicle_counts.get(lane, 0)
+        vehicle_count = self.intersection_status.get_vehicle_count(lane)
         
         # Base duration
         base_duration = settings.default_green_signal_duration
@@ -190,7 +190,7 @@ class AdaptiveTrafficManager(LoggerMixin):
         max_duration = 0
         
         for perp_lane in perpendicular_lanes:
-            vehicle_count = self.intersection_status.vehicle_counts.get(perp_lane, 0)
+            vehicle_count = self.intersection_status.get_vehicle_count(perp_lane)
             green_time = self._calculate_green_duration(perp_lane)
             total_time = green_time + settings.yellow_signal_duration
             max_duration = max(max_duration, total_time)
@@ -199,9 +199,9 @@ class AdaptiveTrafficManager(LoggerMixin):
     
     async def update_vehicle_counts(self, lane_counts: Dict[LaneDirection, int]) -> None:
         """Update vehicle counts from detection results"""
-        self.intersection_status.vehicle_counts = lane_counts
+        self.intersection_status.set_vehicle_counts(lane_counts)
         self.intersection_status.total_vehicles = sum(lane_counts.values())
-        self.intersection_status.last_detection_time = datetime.utcnow()
+        self.intersection_status.last_detection_time = utcnow()
         
         # Trigger optimization if needed
         await self._optimize_signal_timing()
@@ -224,7 +224,7 @@ class AdaptiveTrafficManager(LoggerMixin):
         
         # If there's a significantly busier lane, prioritize it
         if busiest_lane and max_vehicles > 0:
-            current_signal = self.intersection_status.traffic_signals[busiest_lane]
+            current_signal = self.intersection_status.get_signal(busiest_lane)
             
             # If the busiest lane is red and has high traffic, consider early activation
             if (current_signal.current_state == TrafficSignalState.RED and 
@@ -239,7 +239,7 @@ class AdaptiveTrafficManager(LoggerMixin):
         perpendicular_lanes = self._get_perpendicular_lanes(lane)
         
         for perp_lane in perpendicular_lanes:
-            perp_signal = self.intersection_status.traffic_signals[perp_lane]
+            perp_signal = self.intersection_status.get_signal(perp_lane)
             # Don't interrupt if perpendicular lane just started green cycle
             if (perp_signal.current_state == TrafficSignalState.GREEN and 
                 perp_signal.remaining_time > settings.minimum_green_duration):
@@ -253,7 +253,7 @@ class AdaptiveTrafficManager(LoggerMixin):
         perpendicular_lanes = self._get_perpendicular_lanes(lane)
         
         for perp_lane in perpendicular_lanes:
-            perp_signal = self.intersection_status.traffic_signals[perp_lane]
+            perp_signal = self.intersection_status.get_signal(perp_lane)
             if perp_signal.current_state == TrafficSignalState.GREEN:
                 # Reduce to minimum green time
                 perp_signal.remaining_time = min(
@@ -270,7 +270,7 @@ class AdaptiveTrafficManager(LoggerMixin):
         
         # Immediately switch emergency lane to green
         emergency_lane = alert.detected_lane
-        emergency_signal = self.intersection_status.traffic_signals[emergency_lane]
+        emergency_signal = self.intersection_status.get_signal(emergency_lane)
         
         # Set all other signals to red
         for lane, signal in self.intersection_status.traffic_signals.items():
@@ -296,11 +296,10 @@ class AdaptiveTrafficManager(LoggerMixin):
         """Automatically resolve emergency alert after specified delay"""
         await asyncio.sleep(delay)
         
-        if alert_id in self.emergency_alerts:
-            self.emergency_alerts[alert_id].is_active = False
-            self.emergency_alerts[alert_id].resolved_at = datetime.utcnow()
-            del self.emergency_alerts[alert_id]
-            
+        # EmergencyAlert is frozen, so drop the tracked instance instead of
+        # flipping is_active in place; any copy kept elsewhere stays as-issued
+        alert = self.emergency_alerts.pop(alert_id, None)
+        if alert is not None:
             # Check if there are other active emergencies
             if not self.emergency_alerts:
                 self.intersection_status.emergency_mode_active = False
@@ -308,7 +307,7 @@ class AdaptiveTrafficManager(LoggerMixin):
     
     async def _check_emergency_overrides(self) -> None:
         """Check for expired emergency overrides"""
-        current_time = datetime.utcnow()
+        current_time = utcnow()
         expired_alerts = []
         
         for alert_id, alert in self.emergency_alerts.items():
@@ -4,6 +4,7 @@ Provides traffic data analysis, reporting, and performance metrics
 """
 
 import asyncio
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from collections import defaultdict, deque
@@ -12,10 +13,22 @@ from ..core.config import settings
 from ..core.logger import LoggerMixin
 from ..models.traffic_models import (
     VehicleDetectionResult, IntersectionStatus, 
-    LaneDirection, TrafficSnapshot
+    LaneDirection, TrafficSnapshot, utcnow
 )
 
 
+@dataclass(slots=True)
+class DetectionRecord:
+    """Internal history entry pairing a detection result with its ingest time.
+
+    A slotted dataclass instead of a per-record dict: these are pure internal
+    carriers that never cross the API boundary, so they need no validation,
+    and the fixed slot layout is cheaper than a two-key hash table per record.
+    """
+    timestamp: datetime
+    result: VehicleDetectionResult
+
+
 class TrafficAnalyticsService(LoggerMixin):
     """Advanced traffic analytics and reporting service"""
     
@@ -34,7 +47,11 @@ class TrafficAnalyticsService(LoggerMixin):
         }
         self.hourly_traffic_data = defaultdict(list)
         self.daily_summaries = {}
-        self.service_start_time = datetime.utcnow()
+        self.service_start_time = utcnow()
+        # Running aggregates so per-detection updates and summary queries stay
+        # O(1) instead of rescanning the whole history deque
+        self._peak_vehicle_count = 0
+        self._total_processing_time = 0.0
     
     async def initialize(self) -> None:
         """Initialize analytics service"""
@@ -48,10 +65,7 @@ class TrafficAnalyticsService(LoggerMixin):
         """Record a vehicle detection result for analysis"""
         try:
             # Add to detection history
-            self.detection_history.append({
-                'timestamp': timestamp,
-                'result': detection_result
-            })
+            self.detection_history.append(DetectionRecord(timestamp, detection_result))
             
             # Update performance metrics
             await self._update_performance_metrics(detection_result)
@@ -92,10 +106,12 @@ class TrafficAnalyticsService(LoggerMixin):
         )
         self.performance_metrics['average_vehicles_per_detection'] = new_avg
         
-        # Update peak traffic time
-        if (self.performance_metrics['peak_traffic_time'] is None or 
-            detection_result.total_vehicles > self._get_max_vehicles_from_history()):
+        # Update peak traffic time against the running maximum
+        if (self.performance_metrics['peak_traffic_time'] is None or
+            detection_result.total_vehicles > self._peak_vehicle_count):
             self.performance_metrics['peak_traffic_time'] = detection_result.detection_timestamp
+            self._peak_vehicle_count = detection_result.total_vehicles
+        self._total_processing_time += detection_result.processing_time
         
         # Update busiest lane
         busiest_lane = max(detection_result.lane_counts.items(), key=lambda x: x[1])
@@ -103,14 +119,9 @@ class TrafficAnalyticsService(LoggerMixin):
             self.performance_metrics['busiest_lane'] = busiest_lane[0]
         
         # Update system uptime
-        uptime = (datetime.utcnow() - self.service_start_time).total_seconds()
+        uptime = (utcnow() - self.service_start_time).total_seconds()
         self.performance_metrics['system_uptime'] = uptime
     
-    def _get_max_vehicles_from_history(self) -> int:
-        """Get maximum vehicle count from detection history"""
-        if not self.detection_history:
-            return 0
-        return max(record['result'].total_vehicles for record in self.detection_history)
     
     async def generate_summary(self, period: str = 'current') -> Dict[str, Any]:
         """Generate comprehensive analytics summary"""
@@ -130,7 +141,7 @@ class TrafficAnalyticsService(LoggerMixin):
     
     async def _generate_current_summary(self) -> Dict[str, Any]:
         """Generate current session analytics summary"""
-        current_time = datetime.utcnow()
+        current_time = utcnow()
         
         # Basic metrics
         summary = {
@@ -145,10 +156,10 @@ class TrafficAnalyticsService(LoggerMixin):
         recent_detections = list(self.detection_history)[-10:] if self.detection_history else []
         if recent_detections:
             summary['recent_traffic'] = {
-                'average_vehicles': sum(r['result'].total_vehicles for r in recent_detections) / len(recent_detections),
-                'peak_vehicles': max(r['result'].total_vehicles for r in recent_detections),
+                'average_vehicles': sum(r.result.total_vehicles for r in recent_detections) / len(recent_detections),
+                'peak_vehicles': max(r.result.total_vehicles for r in recent_detections),
                 'lane_distribution': self._calculate_lane_distribution(recent_detections),
-                'emergency_vehicles_detected': sum(1 for r in recent_detections if r['result'].has_emergency_vehicles)
+                'emergency_vehicles_detected': sum(1 for r in recent_detections if r.result.has_emergency_vehicles)
             }
         
         # Traffic flow analysis
@@ -166,7 +177,7 @@ class TrafficAnalyticsService(LoggerMixin):
     
     async def _generate_hourly_summary(self) -> Dict[str, Any]:
         """Generate hourly traffic summary"""
-        current_hour = datetime.utcnow().strftime('%Y-%m-%d_%H')
+        current_hour = utcnow().strftime('%Y-%m-%d_%H')
         hourly_data = self.hourly_traffic_data.get(current_hour, [])
         
         if not hourly_data:
@@ -193,7 +204,7 @@ class TrafficAnalyticsService(LoggerMixin):
     
     async def _generate_daily_summary(self) -> Dict[str, Any]:
         """Generate daily traffic summary"""
-        today = datetime.utcnow().strftime('%Y-%m-%d')
+        today = utcnow().strftime('%Y-%m-%d')
         
         # Aggregate all hourly data for today
         daily_detections = []
@@ -226,13 +237,13 @@ class TrafficAnalyticsService(LoggerMixin):
             'emergency_events': sum(1 for d in daily_detections if d.has_emergency_vehicles)
         }
     
-    def _calculate_lane_distribution(self, detections: List[Dict]) -> Dict[str, float]:
+    def _calculate_lane_distribution(self, detections: List[DetectionRecord]) -> Dict[str, float]:
         """Calculate vehicle distribution across lanes"""
         lane_totals = defaultdict(int)
         total_vehicles = 0
         
         for record in detections:
-            for lane, count in record['result'].lane_counts.items():
+            for lane, count in record.result.lane_counts.items():
                 lane_totals[lane] += count
                 total_vehicles += count
         
@@ -255,14 +266,14 @@ class TrafficAnalyticsService(LoggerMixin):
         first_half = recent_records[:len(recent_records)//2]
         second_half = recent_records[len(recent_records)//2:]
         
-        first_avg = sum(r['result'].total_vehicles for r in first_half) / len(first_half)
-        second_avg = sum(r['result'].total_vehicles for r in second_half) / len(second_half)
+        first_avg = sum(r.result.total_vehicles for r in first_half) / len(first_half)
+        second_avg = sum(r.result.total_vehicles for r in second_half) / len(second_half)
         
         trend = 'increasing' if second_avg > first_avg else 'decreasing' if second_avg < first_avg else 'stable'
         trend_percentage = abs((second_avg - first_avg) / max(first_avg, 1)) * 100
         
         # Processing time trend
-        processing_times = [r['result'].processing_time for r in recent_records]
+        processing_times = [r.result.processing_time for r in recent_records]
         avg_processing_time = sum(processing_times) / len(processing_times)
         
         return {
@@ -273,14 +284,13 @@ class TrafficAnalyticsService(LoggerMixin):
         }
     
     def _calculate_average_processing_time(self) -> float:
-        """Calculate average processing time across all detections"""
-        if not self.detection_history:
+        """Calculate average processing time across all recorded detections"""
+        total_detections = self.performance_metrics['total_detections']
+        if not total_detections:
             return 0.0
-        
-        total_time = sum(record['result'].processing_time for record in self.detection_history)
-        return total_time / len(self.detection_history)
+        return self._total_processing_time / total_detections
     
-    def _calculate_data_quality_score(self, records: List[Dict]) -> float:
+    def _calculate_data_quality_score(self, records: List[DetectionRecord]) -> float:
         """Calculate data quality score based on confidence levels"""
         if not records:
             return 0.0
@@ -289,7 +299,7 @@ class TrafficAnalyticsService(LoggerMixin):
         total_detections = 0
         
         for record in records:
-            confidence_scores = record['result'].confidence_scores
+            confidence_scores = record.result.confidence_scores
             if confidence_scores:
                 total_confidence += sum(confidence_scores)
                 total_detections += len(confidence_scores)
@@ -301,12 +311,12 @@ class TrafficAnalyticsService(LoggerMixin):
     
     async def get_traffic_heatmap_data(self, hours: int = 24) -> Dict[str, Any]:
         """Generate traffic heatmap data for visualization"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        cutoff_time = utcnow() - timedelta(hours=hours)
         
         # Filter recent detections
         recent_detections = [
             record for record in self.detection_history
-            if record['timestamp'] >= cutoff_time
+            if record.timestamp >= cutoff_time
         ]
         
         if not recent_detections:
@@ -316,8 +326,8 @@ class TrafficAnalyticsService(LoggerMixin):
         heatmap_data = defaultdict(lambda: defaultdict(int))
         
         for record in recent_detections:
-            hour = record['timestamp'].strftime('%H')
-            for lane, count in record['result'].lane_counts.items():
+            hour = record.timestamp.strftime('%H')
+            for lane, count in record.result.lane_counts.items():
                 heatmap_data[hour][lane.value] += count
         
         return {
@@ -328,7 +338,7 @@ class TrafficAnalyticsService(LoggerMixin):
     
     async def get_performance_report(self) -> Dict[str, Any]:
         """Generate detailed performance report"""
-        current_time = datetime.utcnow()
+        current_time = utcnow()
         uptime = current_time - self.service_start_time
         
         return {
@@ -343,7 +353,7 @@ class TrafficAnalyticsService(LoggerMixin):
                 'detection_rate_per_minute': len(self.detection_history) / max(1, uptime.total_seconds() / 60)
             },
             'traffic_insights': {
-                'total_vehicles_detected': sum(r['result'].total_vehicles for r in self.detection_history),
+                'total_vehicles_detected': sum(r.result.total_vehicles for r in self.detection_history),
                 'average_processing_time': self._calculate_average_processing_time(),
                 'data_quality_score': self._calculate_data_quality_score(list(self.detection_history))
             },
@@ -363,4 +373,6 @@ class TrafficAnalyticsService(LoggerMixin):
         self.detection_history.clear()
         self.traffic_snapshots.clear()
         self.hourly_traffic_data.clear()
+        self._peak_vehicle_count = 0
+        self._total_processing_time = 0.0
         self.logger.info("Analytics service cleanup completed")
\ No newline at end of file
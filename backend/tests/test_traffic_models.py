@@ -0,0 +1,181 @@
+"""
+Tests for Traffic Management Data Models
+Covers wire-format compatibility and validation behavior of the Pydantic models
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.traffic_models import (
+    BoundingBox, CenterPoint, DetectedVehicle, DetectedVehiclesBatch,
+    EmergencyAlert, EmergencyType, IntersectionStatus, LaneDirection,
+    VehicleDetectionResult,
+)
+
+
+def make_vehicle(**overrides):
+    """Build a valid DetectedVehicle, accepting keyword overrides"""
+    params = dict(
+        vehicle_type='car',
+        confidence=0.8,
+        bounding_box={'x1': 100, 'y1': 100, 'x2': 200, 'y2': 180},
+        center_coordinates={'x': 0.5, 'y': 0.2},
+        lane=LaneDirection.NORTH,
+    )
+    params.update(overrides)
+    return DetectedVehicle(**params)
+
+
+class TestDetectedVehicle:
+    """Test suite for DetectedVehicle coordinate handling and coercion"""
+
+    def test_accepts_legacy_dict_coordinates(self):
+        """Dict-form bounding box and center inputs still validate"""
+        vehicle = make_vehicle()
+
+        assert vehicle.bounding_box == BoundingBox(100, 100, 200, 180)
+        assert vehicle.center_coordinates == CenterPoint(0.5, 0.2)
+
+    def test_accepts_namedtuple_coordinates(self):
+        """The tuple form the detector produces validates directly"""
+        vehicle = make_vehicle(
+            bounding_box=BoundingBox(100, 100, 200, 180),
+            center_coordinates=CenterPoint(0.5, 0.2),
+        )
+
+        assert vehicle.bounding_box.x2 == 200
+        assert vehicle.center_coordinates.y == 0.2
+
+    def test_serializes_coordinates_as_objects(self):
+        """The wire format stays keyed objects, not bare tuples"""
+        dumped = make_vehicle().model_dump()
+
+        assert dumped['bounding_box'] == {'x1': 100, 'y1': 100, 'x2': 200, 'y2': 180}
+        assert dumped['center_coordinates'] == {'x': 0.5, 'y': 0.2}
+
+    def test_rejects_invalid_geometry(self):
+        """Degenerate boxes and out-of-range centers fail validation"""
+        with pytest.raises(ValidationError):
+            make_vehicle(bounding_box={'x1': 200, 'y1': 100, 'x2': 100, 'y2': 180})
+
+        with pytest.raises(ValidationError):
+            make_vehicle(center_coordinates={'x': 1.5, 'y': 0.2})
+
+    def test_unhashable_enum_input_is_a_validation_error(self):
+        """Non-scalar lane/type input must be a 422, not a TypeError"""
+        with pytest.raises(ValidationError):
+            make_vehicle(lane=['north'])
+
+        with pytest.raises(ValidationError):
+            make_vehicle(vehicle_type={'type': 'car'})
+
+
+class TestVehicleDetectionResult:
+    """Test suite for detection-result aggregation and serialization"""
+
+    def make_result(self, vehicles):
+        return VehicleDetectionResult(
+            lane_counts={LaneDirection.NORTH: len(vehicles)},
+            detected_vehicles=vehicles,
+            confidence_scores=[v.confidence for v in vehicles],
+            processing_time=0.1,
+            image_path='test.jpg',
+        )
+
+    def test_computed_totals(self):
+        """Totals derive from the vehicle list instead of stored state"""
+        result = self.make_result([make_vehicle(), make_vehicle(is_emergency=True)])
+
+        assert result.total_vehicles == 2
+        assert result.has_emergency_vehicles
+
+    def test_computed_fields_serialize_under_legacy_keys(self):
+        """Clients keep seeing total_vehicles / has_emergency_vehicles"""
+        dumped = self.make_result([make_vehicle()]).model_dump()
+
+        assert dumped['total_vehicles'] == 1
+        assert dumped['has_emergency_vehicles'] is False
+
+    def test_lane_counts_filled_for_missing_lanes(self):
+        """Partial lane_counts input is padded to all four lanes"""
+        result = self.make_result([make_vehicle()])
+
+        assert set(result.lane_counts) == set(LaneDirection)
+        assert result.lane_counts[LaneDirection.SOUTH] == 0
+
+    def test_batch_round_trip(self):
+        """SoA batch aggregation matches the model list it was built from"""
+        vehicles = [
+            make_vehicle(),
+            make_vehicle(vehicle_type='truck', lane=LaneDirection.EAST),
+        ]
+        batch = DetectedVehiclesBatch.from_models(vehicles)
+
+        assert batch.lane_counts()[LaneDirection.NORTH] == 1
+        assert batch.lane_counts()[LaneDirection.EAST] == 1
+        assert not batch.has_emergency_vehicles()
+
+        restored = batch.to_models()
+        assert [v.lane for v in restored] == [v.lane for v in vehicles]
+        # Confidence is q16-quantized in the batch; round trip within 1/65535
+        assert restored[0].confidence == pytest.approx(0.8, abs=1e-4)
+
+
+class TestIntersectionStatus:
+    """Test suite for intersection-state accessors and serialization"""
+
+    def test_vehicle_counts_round_trip(self):
+        """Adopted counts come back through the computed field"""
+        status = IntersectionStatus()
+        counts = {lane: 0 for lane in LaneDirection}
+        counts[LaneDirection.NORTH] = 3
+        status.set_vehicle_counts(counts)
+
+        assert status.get_vehicle_count(LaneDirection.NORTH) == 3
+        dumped = status.model_dump()
+        assert dumped['vehicle_counts'][LaneDirection.NORTH] == 3
+
+    def test_partial_counts_are_normalized(self):
+        """Missing lanes default to zero when counts are adopted"""
+        status = IntersectionStatus()
+        status.set_vehicle_counts({LaneDirection.EAST: 2})
+
+        assert status.get_vehicle_count(LaneDirection.EAST) == 2
+        assert status.get_vehicle_count(LaneDirection.WEST) == 0
+
+
+class TestEmergencyAlert:
+    """Test suite for emergency alert validation"""
+
+    def make_alert(self, **overrides):
+        params = dict(
+            alert_id='alert-1',
+            emergency_type='ambulance',
+            detected_lane='north',
+            vehicle_location={'x': 0.5, 'y': 0.5},
+            priority_level=1,
+        )
+        params.update(overrides)
+        return EmergencyAlert(**params)
+
+    def test_string_enums_are_coerced(self):
+        """Inbound wire strings resolve to enum members"""
+        alert = self.make_alert()
+
+        assert alert.emergency_type is EmergencyType.AMBULANCE
+        assert alert.detected_lane is LaneDirection.NORTH
+
+    def test_unhashable_enum_input_is_a_validation_error(self):
+        """Malformed override bodies must fail validation, not crash"""
+        with pytest.raises(ValidationError):
+            self.make_alert(detected_lane=['north'])
+
+        with pytest.raises(ValidationError):
+            self.make_alert(emergency_type={'type': 'ambulance'})
+
+    def test_alert_is_frozen(self):
+        """Alerts are immutable once issued"""
+        alert = self.make_alert()
+
+        with pytest.raises(ValidationError):
+            alert.is_active = False